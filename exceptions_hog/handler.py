@@ -1,11 +1,24 @@
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
 from django.core.signals import got_request_exception
 from django.db.models import ProtectedError
 from django.http import Http404
+from django.utils.encoding import force_str
 from django.utils.translation import gettext as _
 from rest_framework import exceptions, status
 from rest_framework.response import Response
@@ -14,10 +27,13 @@ from rest_framework.views import set_rollback
 
 from .exceptions import ProtectedObjectException
 from .settings import api_settings
-from .utils import ensure_string
+from .utils import to_string
 
 DEFAULT_ERROR_DETAIL = _("A server error occurred.")
 
+# Sentinel for optional exception attributes, so they're looked up only once
+_MISSING: Any = object()
+
 
 class ErrorTypes(Enum):
     """
@@ -33,184 +49,254 @@ class ErrorTypes(Enum):
     multiple_exceptions = "multiple"
 
 
-@ensure_string
-def _get_error_type(exc) -> Union[str, ErrorTypes]:
+_MULTIPLE_EXCEPTIONS_TYPE: str = ErrorTypes.multiple_exceptions.value
+
+# Static part of every multiple exceptions response, the `list` is added per response
+_MULTIPLE_EXCEPTIONS_RESPONSE: Dict[str, Any] = {
+    "type": _MULTIPLE_EXCEPTIONS_TYPE,
+    "code": _MULTIPLE_EXCEPTIONS_TYPE,
+    "detail": "Multiple exceptions ocurred. Please check list for details.",
+    "attr": None,
+}
+
+
+# Default configuration for DRF exceptions
+_EXC_TYPE_MAP: Dict[type, str] = {
+    exceptions.AuthenticationFailed: ErrorTypes.authentication_error.value,
+    exceptions.MethodNotAllowed: ErrorTypes.invalid_request.value,
+    exceptions.NotAcceptable: ErrorTypes.invalid_request.value,
+    exceptions.NotAuthenticated: ErrorTypes.authentication_error.value,
+    exceptions.NotFound: ErrorTypes.invalid_request.value,
+    exceptions.ParseError: ErrorTypes.invalid_request.value,
+    exceptions.PermissionDenied: ErrorTypes.authentication_error.value,
+    exceptions.Throttled: ErrorTypes.throttled_error.value,
+    exceptions.UnsupportedMediaType: ErrorTypes.invalid_request.value,
+    exceptions.ValidationError: ErrorTypes.validation_error.value,
+}
+
+
+def _get_error_type(exc) -> str:
     """
     Gets the `type` for the exception. Default types are defined for base DRF exceptions.
     """
-    if hasattr(exc, "exception_type"):
+    exception_type = getattr(exc, "exception_type", _MISSING)
+    if exception_type is not _MISSING:
         # Attempt first to get the type defined for this specific instance
-        return exc.exception_type
-    elif hasattr(exc, "default_type"):
-        # Use the exception class default type if available
-        return exc.default_type
-
-    # Default configuration for DRF exceptions
-    if isinstance(exc, exceptions.AuthenticationFailed):
-        return ErrorTypes.authentication_error
-    elif isinstance(exc, exceptions.MethodNotAllowed):
-        return ErrorTypes.invalid_request
-    elif isinstance(exc, exceptions.NotAcceptable):
-        return ErrorTypes.invalid_request
-    elif isinstance(exc, exceptions.NotAuthenticated):
-        return ErrorTypes.authentication_error
-    elif isinstance(exc, exceptions.NotFound):
-        return ErrorTypes.invalid_request
-    elif isinstance(exc, exceptions.ParseError):
-        return ErrorTypes.invalid_request
-    elif isinstance(exc, exceptions.PermissionDenied):
-        return ErrorTypes.authentication_error
-    elif isinstance(exc, exceptions.Throttled):
-        return ErrorTypes.throttled_error
-    elif isinstance(exc, exceptions.UnsupportedMediaType):
-        return ErrorTypes.invalid_request
-    elif isinstance(exc, exceptions.ValidationError):
-        return ErrorTypes.validation_error
+        return to_string(exception_type)
+
+    default_type = getattr(exc, "default_type", _MISSING)
+    if default_type is not _MISSING:
+        # Use the exception class default type if available. Read from the instance
+        # so overrides, properties and lazy values resolve on every call.
+        return to_string(default_type)
+
+    return _resolve_type_for_class(exc.__class__)
+
+
+@lru_cache(maxsize=512)
+def _resolve_type_for_class(cls: type) -> str:
+    """
+    Gets the default `type` mapped to an exception class. The result only depends on
+    the class, so it's cached. The cache is bounded (least recently used classes are
+    evicted) so dynamically created exception classes can't grow it indefinitely.
+    """
+    # Subclasses resolve to their closest mapped ancestor
+    for base in cls.__mro__:
+        if base in _EXC_TYPE_MAP:
+            return _EXC_TYPE_MAP[base]
 
     # Couldn't determine type, default to generic error
-    return ErrorTypes.server_error
+    return ErrorTypes.server_error.value
+
+
+class NormalizedExceptionCode(NamedTuple):
+    """
+    A single exception code from a (possibly nested) exception, along with the keys
+    leading to the offending attribute.
+    """
+
+    parsed_keys: Tuple[str, ...]
+    exception_code: Union[str, List[str]]
 
 
 def _normalize_exception_codes(
     exception_codes: Dict,
-    parent_key: Optional[List[str]] = None,
-) -> List[Dict[str, Union[str, List[str]]]]:
+    parent_key: Tuple[str, ...] = (),
+) -> Iterator[NormalizedExceptionCode]:
     """
-    Returns a normalized one-level dictionary of exception attributes and codes. Used to
-    standardize multiple exceptions and complex nested exceptions.
+    Yields the normalized one-level exception attributes and codes. Used to standardize
+    multiple exceptions and complex nested exceptions. Codes are produced lazily, so
+    callers that only need the main exception can stop after the first one.
     Example:
      => [
-         {
-             "parsed_keys": ["form", "password"],
-             "exception_code": ["required"]
-         },
-         {
-             "parsed_keys": ["form", "password"],
-             "exception_code": "min_length"
-         }
+         NormalizedExceptionCode(
+             parsed_keys=("form", "password"),
+             exception_code=["required"],
+         ),
+         NormalizedExceptionCode(
+             parsed_keys=("form", "password"),
+             exception_code="min_length",
+         ),
      ]
     """
-    if parent_key is None:
-        parent_key = []
+    parents: List[str] = list(parent_key)
+
+    if len(exception_codes) == 1:
+        # Fast path for the most common case, a single non-nested attribute
+        key, exception_code = next(iter(exception_codes.items()))
+        if type(exception_code) is not dict:
+            yield NormalizedExceptionCode((*parents, key), exception_code)
+            return
+
+    # Depth-first walk with an explicit stack of remaining items so each nested dict is
+    # visited once, read-only, and in its original order. `parents` is shared across
+    # siblings and only copied when a leaf is emitted.
+    stack = [iter(exception_codes.items())]
+    while stack:
+        for key, exception_code in stack[-1]:
+            # DRF's `get_codes()` always builds plain dicts and lists, so an exact type
+            # check is enough
+            if type(exception_code) is dict:
+                # Descend first, the remaining siblings are resumed afterwards
+                parents.append(key)
+                stack.append(iter(exception_code.items()))
+                break
+
+            yield NormalizedExceptionCode((*parents, key), exception_code)
+        else:
+            stack.pop()
+            if stack:
+                parents.pop()
 
-    items: List = []
-    for key, exception_code in exception_codes.items():
 
-        keys: List[str] = parent_key + [key]
+ExceptionCode = Union[NormalizedExceptionCode, Dict, str, List, None]
+ExceptionCodes = Iterable[ExceptionCode]
 
-        if isinstance(exception_code, dict):
-            items.extend(
-                _normalize_exception_codes(
-                    exception_code.copy(),
-                    keys,
-                )
-            )
-        else:
-            items.append({"parsed_keys": keys, "exception_code": exception_code})
-    return items
 
+def _override_code(code: str) -> str:
+    """
+    Returns overridden code if needs to change or provided code.
+    """
+    if code == "invalid":
+        # Special handling for validation errors. Use `invalid_input` instead
+        # of `invalid` to provide more clarity.
+        return "invalid_input"
+
+    return code
 
-def _get_main_exception_and_code(
-    exception_codes: Union[Dict, str, List, None]
-) -> Tuple[str, Optional[str]]:
-    def override_or_return(code: str) -> str:
-        """
-        Returns overridden code if needs to change or provided code.
-        """
-        if code == "invalid":
-            # Special handling for validation errors. Use `invalid_input` instead
-            # of `invalid` to provide more clarity.
-            return "invalid_input"
-
-        return code
 
+def _get_normalized_exception_and_code(
+    normalized: NormalizedExceptionCode,
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Returns the code and keys for parsed nested attributes (see
+    `_normalize_exception_codes`).
+    """
+    code = normalized.exception_code
+    if isinstance(code, list):
+        code = code[0]
+    return _override_code(str(code)), normalized.parsed_keys
+
+
+def _get_main_exception_and_code(
+    exception_codes: ExceptionCode,
+) -> Tuple[str, Optional[Union[str, Tuple[str, ...]]]]:
     # Get base exception codes from DRF (if exception is DRF)
     if exception_codes:
         codes = exception_codes
 
-        if isinstance(codes, dict) and "parsed_keys" in codes:
-            # Handling for parsed nested attributes (see `_normalize_exception_codes`)
-            code = (
-                codes["exception_code"][0]
-                if isinstance(codes["exception_code"], list)
-                else codes["exception_code"]
-            )
-            return override_or_return(str(code)), codes["parsed_keys"]
-
         if isinstance(codes, str):
             # Only one exception, return
             return codes, None
+        elif isinstance(codes, NormalizedExceptionCode):
+            return _get_normalized_exception_and_code(codes)
         elif isinstance(codes, dict):
             # If object is a dict or nested dict, return the key of the very first error
             key = next(iter(codes))  # Get initial key
-            code = codes[key] if isinstance(codes[key], str) else codes[key][0]
-            return override_or_return(code), key
+            code = codes[key]
+            if not isinstance(code, str):
+                code = code[0]
+            return _override_code(code), key
         elif isinstance(codes, list):
-            return override_or_return(str(codes[0])), None
+            return _override_code(str(codes[0])), None
 
     return "error", None
 
 
-@ensure_string
-def _get_detail(exc, exception_key: Union[str, List[str]] = "") -> str:
+def _get_detail(
+    exc, exception_key: Optional[Union[str, Tuple[str, ...]]] = None
+) -> str:
     """
     Returns the human-friendly detail text for a specific insight exception.
     """
 
-    if hasattr(exc, "detail"):
-        # Get exception details if explicitly set. We don't obtain exception information
-        # from base Python exceptions to avoid leaking sensitive information.
-        if isinstance(exc.detail, str):
-            return str(
-                exc.detail
-            )  # We do str() to get the actual error string on ErrorDetail instances
-        elif isinstance(exc.detail, dict):
-            value = exc.detail
-
-            # Handle nested attributes
-            if isinstance(exception_key, list):
-                for key in exception_key:
-                    value = value[key]
-
-            return str(value if isinstance(value, str) else value[0])
-        elif isinstance(exc.detail, list) and len(exc.detail) > 0:
-            return exc.detail[0]
+    # Get exception details if explicitly set. We don't obtain exception information
+    # from base Python exceptions to avoid leaking sensitive information.
+    detail = getattr(exc, "detail", _MISSING)
+
+    if isinstance(detail, str):
+        # We do str() to get the actual error string on ErrorDetail instances
+        return str(detail)
+    elif isinstance(detail, dict):
+        # Handle nested attributes
+        if isinstance(exception_key, tuple):
+            for key in exception_key:
+                detail = detail[key]
+
+        return str(detail if isinstance(detail, str) else detail[0])
+    elif isinstance(detail, list) and detail:
+        return force_str(detail[0])
 
     return DEFAULT_ERROR_DETAIL
 
 
-def _get_attr(exception_key: Optional[Union[str, List[str]]] = None) -> Optional[str]:
+def _get_attr(
+    exception_key: Optional[Union[str, Tuple[str, ...]]] = None
+) -> Optional[str]:
     """
     Returns the offending attribute name. Handles special case
         of __all__ (used for instance in UniqueTogetherValidator) to return `None`.
     """
 
-    def override_or_return(final_key: Optional[str]) -> Optional[str]:
-        """
-        Returns overridden code if needs to change or provided code.
-        """
-        if final_key == "__all__":
-            return None
+    attr: Optional[str]
+    if isinstance(exception_key, tuple):
+        if len(exception_key) == 1:
+            # Not nested, no need to build a joined string
+            attr = str(exception_key[0])
+        else:
+            attr = api_settings.NESTED_KEY_SEPARATOR.join(map(str, exception_key))
+    else:
+        attr = exception_key
 
-        if final_key == drf_api_settings.NON_FIELD_ERRORS_KEY:
-            return None
+    if not attr or attr == "__all__" or attr == drf_api_settings.NON_FIELD_ERRORS_KEY:
+        return None
 
-        return final_key if final_key else None
+    return attr
 
-    if isinstance(exception_key, list):
-        return override_or_return(
-            api_settings.NESTED_KEY_SEPARATOR.join(map(str, exception_key))
-        )
 
-    return override_or_return(exception_key)
+def _get_http_status(exc) -> int:
+    return getattr(exc, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-def _get_http_status(exc) -> int:
-    return (
-        exc.status_code
-        if hasattr(exc, "status_code")
-        else status.HTTP_500_INTERNAL_SERVER_ERROR
-    )
+# Django base exceptions that are converted to an equivalent API exception
+_DJANGO_EXCEPTIONS = (Http404, PermissionDenied, ProtectedError)
+
+# Exceptions handled even in DEBUG mode, checked before any Django exception is
+# coerced (`Http404` and `PermissionDenied` are coerced to API exceptions)
+_HANDLED_IN_DEBUG_EXCEPTIONS = (exceptions.APIException, Http404, PermissionDenied)
+
+
+def _coerce_django_exception(exc: BaseException) -> BaseException:
+    if isinstance(exc, Http404):
+        return exceptions.NotFound()
+    elif isinstance(exc, PermissionDenied):
+        return exceptions.PermissionDenied()
+    elif isinstance(exc, ProtectedError):
+        return ProtectedObjectException(
+            "",
+            protected_objects=exc.protected_objects,
+        )
+    return exc
 
 
 def exception_reporter(exc: BaseException, context: Optional[Dict] = None) -> None:
@@ -228,21 +314,10 @@ def exception_handler(
 ) -> Optional[Response]:
     request = context["request"] if context and "request" in context else None
 
-    # Special handling for Django base exceptions first
-    if isinstance(exc, Http404):
-        exc = exceptions.NotFound()
-    elif isinstance(exc, PermissionDenied):
-        exc = exceptions.PermissionDenied()
-    elif isinstance(exc, ProtectedError):
-        exc = ProtectedObjectException(
-            "",
-            protected_objects=exc.protected_objects,
-        )
-
     if (
-        getattr(settings, "DEBUG", False)
+        not isinstance(exc, _HANDLED_IN_DEBUG_EXCEPTIONS)
+        and getattr(settings, "DEBUG", False)
         and not api_settings.ENABLE_IN_DEBUG
-        and not isinstance(exc, exceptions.APIException)
     ):
         # By default don't handle non-DRF errors in DEBUG mode, i.e. Django will treat
         # unhandled exceptions regularly (very evident yellow error page)
@@ -258,55 +333,66 @@ def exception_handler(
         )
         return None
 
-    base_exception_list: Union[
-        List[List[Any]], List[None], List[Dict[str, Union[str, List[str]]]]
-    ]
+    # Special handling for Django base exceptions
+    if isinstance(exc, _DJANGO_EXCEPTIONS):
+        exc = _coerce_django_exception(exc)
+
+    base_exception_codes: ExceptionCodes
     if isinstance(exc, exceptions.ValidationError):
         codes = exc.get_codes()
         if isinstance(codes, list):
-            base_exception_list = [codes]
+            base_exception_codes = [codes]
         else:
-            base_exception_list = _normalize_exception_codes(cast(Dict, codes))
+            base_exception_codes = _normalize_exception_codes(cast(Dict, codes))
     elif hasattr(exc, "get_codes"):
-        base_exception_list = [exc.get_codes()]  # type: ignore
+        base_exception_codes = [exc.get_codes()]
     else:
-        base_exception_list = [None]
-
-    exception_list = [
-        _get_main_exception_and_code(exception) for exception in base_exception_list
-    ]
+        base_exception_codes = [None]
 
     event_id = api_settings.EXCEPTION_REPORTING(exc, context)
 
     set_rollback()
 
-    if api_settings.SUPPORT_MULTIPLE_EXCEPTIONS and len(exception_list) > 1:
-        response = dict(
-            type=ErrorTypes.multiple_exceptions.value,
-            code=ErrorTypes.multiple_exceptions.value,
-            detail="Multiple exceptions ocurred. Please check list for details.",
-            attr=None,
-            list=[
-                dict(
-                    type=_get_error_type(exc),
-                    code=exception_code,
-                    detail=_get_detail(exc, exception_key),
-                    attr=_get_attr(exception_key),
-                )
-                for exception_code, exception_key in exception_list
-            ],
-        )
+    # The type only depends on the exception itself, not on each exception code
+    error_type = _get_error_type(exc)
+
+    base_exception_list: List[ExceptionCode]
+    if api_settings.SUPPORT_MULTIPLE_EXCEPTIONS:
+        base_exception_list = list(base_exception_codes)
     else:
-        response = dict(
-            type=_get_error_type(exc),
-            code=exception_list[0][0],
-            detail=_get_detail(exc, exception_list[0][1]),
-            attr=_get_attr(exception_list[0][1]),
+        # Only the main exception is returned, don't normalize the remaining ones
+        base_exception_list = [next(iter(base_exception_codes), None)]
+
+    response: Dict[str, Any]
+    if len(base_exception_list) > 1:
+        response = _MULTIPLE_EXCEPTIONS_RESPONSE.copy()
+        response["list"] = [
+            {
+                "type": error_type,
+                "code": exception_code,
+                "detail": _get_detail(exc, exception_key),
+                "attr": _get_attr(exception_key),
+            }
+            for exception_code, exception_key in map(
+                _get_main_exception_and_code, base_exception_list
+            )
+        ]
+    else:
+        # Only the main exception is returned
+        exception_code, exception_key = _get_main_exception_and_code(
+            base_exception_list[0]
         )
-
-    headers = {}
-    if hasattr(exc, "extra"):  # type: ignore
-        response["extra"] = exc.extra  # type: ignore
+        response = {
+            "type": error_type,
+            "code": exception_code,
+            "detail": _get_detail(exc, exception_key),
+            "attr": _get_attr(exception_key),
+        }
+
+    headers: Dict[str, str] = {}
+    extra = getattr(exc, "extra", _MISSING)
+    if extra is not _MISSING:
+        response["extra"] = extra
     # see https://github.com/encode/django-rest-framework/blob/e08e606c82afd0d5ec82b2c58badec11a4ce825e/rest_framework/views.py#L86-L91 # noqa
     # for the framework code this is based on
     if isinstance(exc, exceptions.APIException) and getattr(exc, "wait", None):
@@ -1,10 +1,9 @@
-from typing import Any, Dict, Optional
+from typing import Dict
 
 from django.conf import settings
+from django.core.signals import setting_changed
 from rest_framework.settings import APISettings
 
-USER_SETTINGS: Optional[Any] = getattr(settings, "EXCEPTIONS_HOG", None)
-
 DEFAULTS: Dict = {
     "EXCEPTION_REPORTING": "exceptions_hog.handler.exception_reporter",
     "ENABLE_IN_DEBUG": False,
@@ -16,4 +15,31 @@ DEFAULTS: Dict = {
 # e.g. `exceptions_hog.exception_handler`
 IMPORT_STRINGS = ("EXCEPTION_REPORTING",)
 
-api_settings: APISettings = APISettings(USER_SETTINGS, DEFAULTS, IMPORT_STRINGS)
+
+class ExceptionsHogSettings(APISettings):
+    """
+    Settings namespaced under `EXCEPTIONS_HOG`. User settings are only read from the
+    Django settings on first access, instead of when this module is imported.
+    """
+
+    @property
+    def user_settings(self) -> Dict:
+        if not hasattr(self, "_user_settings"):
+            self._user_settings = getattr(settings, "EXCEPTIONS_HOG", None) or {}
+        return self._user_settings
+
+
+api_settings: APISettings = ExceptionsHogSettings(None, DEFAULTS, IMPORT_STRINGS)
+
+
+def reload_api_settings(*args, **kwargs) -> None:
+    """
+    `api_settings` caches every setting after its first lookup. Drop the cached values
+    when `EXCEPTIONS_HOG` changes (e.g. with `override_settings`) so they're resolved
+    again.
+    """
+    if kwargs["setting"] == "EXCEPTIONS_HOG":
+        api_settings.reload()
+
+
+setting_changed.connect(reload_api_settings)
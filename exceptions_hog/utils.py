@@ -4,11 +4,14 @@ from typing import Any, Callable
 from django.utils.encoding import force_str
 
 
+def to_string(value: Any) -> str:
+    if isinstance(value, Enum):
+        return force_str(value.value)
+    return force_str(value)
+
+
 def ensure_string(func: Callable) -> Callable:
     def function_wrapper(*args, **kwargs) -> str:
-        return_value: Any = func(*args, **kwargs)
-        if isinstance(return_value, Enum):
-            return force_str(return_value.value)
-        return force_str(return_value)
+        return to_string(func(*args, **kwargs))
 
     return function_wrapper
@@ -1,3 +1,5 @@
+from typing import Callable, Dict
+
 from django.db import transaction
 from rest_framework.exceptions import APIException
 from rest_framework.generics import GenericAPIView
@@ -7,44 +9,70 @@ from .models import Hedgehog
 from .permissions import NoPermission
 from .serializers import ArraySerializer, HedgehogSerializer
 
+# Model fields loaded for the hedgehog views
+_HEDGEHOG_FIELDS = ("id", "name", "color", "age")
+
 
 class HedgehogView(ModelViewSet):
     serializer_class = HedgehogSerializer
-    queryset = Hedgehog.objects.all()
+    queryset = Hedgehog.objects.only(*_HEDGEHOG_FIELDS)
 
 
 class NoPermissionView(ModelViewSet):
     serializer_class = HedgehogSerializer
-    queryset = Hedgehog.objects.all()
+    queryset = Hedgehog.objects.only(*_HEDGEHOG_FIELDS)
     permission_classes = (NoPermission,)
 
 
+def _raise_assertion_error() -> None:
+    assert 1 == 0, "Set a custom message and make sure it isn't leaked in the response."
+
+
+def _raise_arithmetic_error() -> None:
+    1 / 0
+
+
+def _raise_key_error() -> None:
+    sample_dict = {"a": 1}
+    sample_dict["b"]
+
+
+def _raise_api_error() -> None:
+    raise APIException()
+
+
+def _raise_nested_list_on_serializer() -> None:
+    s = ArraySerializer()
+    s.create({"hedgehogs": [{"color": "red"}]})
+
+
+def _raise_in_atomic_transaction() -> None:
+    Hedgehog.objects.create(name="One")
+
+    with transaction.atomic():
+        Hedgehog.objects.create(name="Two")
+        raise APIException()
+
+
+_EXCEPTION_RAISERS: Dict[str, Callable[[], None]] = {
+    "assertion_error": _raise_assertion_error,
+    "arithmetic_error": _raise_arithmetic_error,
+    "key_error": _raise_key_error,
+    "api_error": _raise_api_error,
+    "nested_list_on_serializer": _raise_nested_list_on_serializer,
+    "atomic_transaction": _raise_in_atomic_transaction,
+}
+
+
 class ExceptionView(GenericAPIView):
     def post(self, request, *args, **kwargs):
         """
         Sample view to raise unhandled exception.
         """
-        exception_type: str = request.POST.get("type", "")
-
-        if exception_type == "assertion_error":
-            assert (
-                1 == 0
-            ), "Set a custom message and make sure it isn't leaked in the response."
-        elif exception_type == "arithmetic_error":
-            1 / 0
-        elif exception_type == "key_error":
-            sample_dict = {"a": 1}
-            sample_dict["b"]
-        elif exception_type == "api_error":
-            raise APIException()
-        elif exception_type == "nested_list_on_serializer":
-            s = ArraySerializer()
-            s.create({"hedgehogs": [{"color": "red"}]})
-        elif exception_type == "atomic_transaction":
-            Hedgehog.objects.create(name="One")
-
-            with transaction.atomic():
-                Hedgehog.objects.create(name="Two")
-                raise APIException()
+        exception_type: str = request.data.get("type", "")
+
+        raise_exception = _EXCEPTION_RAISERS.get(exception_type)
+        if raise_exception:
+            raise_exception()
 
         raise Exception("Shouldn't be included in the response.")
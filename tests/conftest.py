@@ -1,90 +1,87 @@
 import base64
-import random
+import itertools
+from types import MappingProxyType
 
 import pytest
 from django.contrib.auth import get_user_model
 
-
-def pytest_configure():
-    from django.conf import settings
-
-    settings.configure(
-        SECRET_KEY="#mk0y8q%rh!ieekh5h#39b@a99u3eg$93kc9oq#z1kpzvg+k2_",
-        INSTALLED_APPS=[
-            "django.contrib.contenttypes",
-            "django.contrib.auth",
-            "rest_framework",
-            "test_project.test_app",
-        ],
-        ROOT_URLCONF="test_project.mysite.urls",
-        DATABASES={
-            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
-        },
-        REST_FRAMEWORK={
-            "EXCEPTION_HANDLER": "exceptions_hog.exception_handler",
-            "DEFAULT_AUTHENTICATION_CLASSES": [
-                "rest_framework.authentication.BasicAuthentication",
-            ],
-        },
-    )
-    try:
-        import django
-
-        django.setup()
-    except AttributeError:
-        pass
+_user_counter = itertools.count()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client():
     from rest_framework.test import APIClient
 
     return APIClient()
 
 
+@pytest.fixture(scope="session")
+def django_client():
+    """
+    Plain Django test client, for requests that don't need DRF's test client features.
+    """
+    from django.test import Client
+
+    return Client()
+
+
 @pytest.fixture
-def auth_header() -> str:
-    username: str = f"user_{random.randint(100,999)}"
+def auth_header(db) -> str:
+    """
+    Basic authentication header for a user created in the test's transaction.
+    """
+    username: str = f"user_{next(_user_counter)}"
     get_user_model().objects._create_user(
         username=username, email=f"{username}@example.com", password="password"
     )
     return f'Basic {base64.b64encode(f"{username}:password".encode()).decode()}'
 
 
-@pytest.fixture
+# Expected responses shared across tests are wrapped in `MappingProxyType` so a test
+# can't modify them for the others. Only the top level is read-only, nested lists and
+# dicts must not be modified either.
+
+
+@pytest.fixture(scope="session")
 def res_not_found():
     """
     Default response for not found exception.
     """
-    return {
-        "type": "invalid_request",
-        "code": "not_found",
-        "detail": "Not found.",
-        "attr": None,
-    }
+    return MappingProxyType(
+        {
+            "type": "invalid_request",
+            "code": "not_found",
+            "detail": "Not found.",
+            "attr": None,
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def res_permission_denied():
     """
     Default response for permission denied exception.
     """
-    return {
-        "type": "authentication_error",
-        "code": "permission_denied",
-        "detail": "You do not have permission to perform this action.",
-        "attr": None,
-    }
+    return MappingProxyType(
+        {
+            "type": "authentication_error",
+            "code": "permission_denied",
+            "detail": "You do not have permission to perform this action.",
+            "attr": None,
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def res_server_error():
     """
     Default response for an unhandled exception (base internal server error).
     """
-    return {
-        "type": "server_error",
-        "code": "error",
-        "detail": "A server error occurred.",
-        "attr": None,
-    }
+    return MappingProxyType(
+        {
+            "type": "server_error",
+            "code": "error",
+            "detail": "A server error occurred.",
+            "attr": None,
+        }
+    )
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from unittest.mock import Mock
 
 import pytest
@@ -6,150 +7,171 @@ from rest_framework import status
 from exceptions_hog.settings import api_settings
 from test_project.test_app.models import Hedgehog
 
+# Expected responses
+_RES_NOT_ALLOWED = MappingProxyType(
+    {
+        "type": "authentication_error",
+        "code": "permission_denied",
+        "detail": "You are not allowed to do this!",
+        "attr": None,
+    }
+)
+_RES_NOT_AUTHENTICATED = MappingProxyType(
+    {
+        "type": "authentication_error",
+        "code": "not_authenticated",
+        "detail": "Authentication credentials were not provided.",
+        "attr": None,
+    }
+)
+_RES_AUTHENTICATION_FAILED = MappingProxyType(
+    {
+        "type": "authentication_error",
+        "code": "authentication_failed",
+        "detail": "Invalid username/password.",
+        "attr": None,
+    }
+)
+_RES_METHOD_NOT_ALLOWED_POST = MappingProxyType(
+    {
+        "type": "invalid_request",
+        "code": "method_not_allowed",
+        "detail": 'Method "POST" not allowed.',
+        "attr": None,
+    }
+)
+_RES_INVALID_AGE = MappingProxyType(
+    {
+        "type": "validation_error",
+        "code": "invalid_input",
+        "detail": "A valid integer is required.",
+        "attr": "age",
+    }
+)
+_RES_REQUIRED_NAME = MappingProxyType(
+    {
+        "type": "validation_error",
+        "code": "required",
+        "detail": "This field is required.",
+        "attr": "name",
+    }
+)
+
 
-@pytest.mark.django_db
 class TestAPI:
-    def test_api_not_found(self, test_client, res_not_found) -> None:
-        response = test_client.get("/hedgehogs/49402")
+    @pytest.mark.django_db
+    def test_api_not_found(self, django_client, res_not_found) -> None:
+        response = django_client.get("/hedgehogs/49402")
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data == res_not_found
 
+    @pytest.mark.django_db
     def test_api_permission_denied(self, test_client, auth_header) -> None:
         response = test_client.get("/denied", HTTP_AUTHORIZATION=auth_header)
         assert response.status_code == status.HTTP_403_FORBIDDEN
-        assert response.data == {
-            "type": "authentication_error",
-            "code": "permission_denied",
-            "detail": "You are not allowed to do this!",
-            "attr": None,
-        }
+        assert response.data == _RES_NOT_ALLOWED
 
+    @pytest.mark.django_db
     def test_api_authentication_failed(self, test_client) -> None:
 
         # Unauthenticated
         response = test_client.get("/denied")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        assert response.data == {
-            "type": "authentication_error",
-            "code": "not_authenticated",
-            "detail": "Authentication credentials were not provided.",
-            "attr": None,
-        }
+        assert response.data == _RES_NOT_AUTHENTICATED
 
         # Authentication failed
         response = test_client.get("/denied", HTTP_AUTHORIZATION="Basic dTpw")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        assert response.data == {
-            "type": "authentication_error",
-            "code": "authentication_failed",
-            "detail": "Invalid username/password.",
-            "attr": None,
-        }
-
-    def test_api_method_not_allowed(self, test_client) -> None:
-        response = test_client.post("/hedgehogs/34")
+        assert response.data == _RES_AUTHENTICATION_FAILED
+
+    def test_api_method_not_allowed(self, django_client) -> None:
+        response = django_client.post("/hedgehogs/34")
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
-        assert response.data == {
-            "type": "invalid_request",
-            "code": "method_not_allowed",
-            "detail": 'Method "POST" not allowed.',
-            "attr": None,
-        }
-
-    def test_api_validation_error(self, test_client) -> None:
-        response = test_client.post(
-            "/hedgehogs", {"name": "Sonic", "color": "blue", "age": "invalid"}
+        assert response.data == _RES_METHOD_NOT_ALLOWED_POST
+
+    def test_api_validation_error(self, django_client) -> None:
+        response = django_client.post(
+            "/hedgehogs",
+            {"name": "Sonic", "color": "blue", "age": "invalid"},
+            content_type="application/json",
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert response.data == {
-            "type": "validation_error",
-            "code": "invalid_input",
-            "detail": "A valid integer is required.",
-            "attr": "age",
-        }
+        assert response.data == _RES_INVALID_AGE
 
-    def test_api_multiple_validation_errors(self, test_client) -> None:
+    def test_api_multiple_validation_errors(self, django_client) -> None:
 
         # This would raise an exception for missing name AND invalid age
         # but only the main exception will be returned
-        response = test_client.post("/hedgehogs", {"color": "blue", "age": "invalid"})
+        response = django_client.post(
+            "/hedgehogs",
+            {"color": "blue", "age": "invalid"},
+            content_type="application/json",
+        )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert response.data == {
-            "type": "validation_error",
-            "code": "required",
-            "detail": "This field is required.",
-            "attr": "name",
-        }
+        assert response.data == _RES_REQUIRED_NAME
 
-    def test_validation_error_on_nested_list(self, test_client) -> None:
+    def test_validation_error_on_nested_list(self, django_client) -> None:
 
-        response = test_client.post("/exception", {"type": "nested_list_on_serializer"})
+        response = django_client.post(
+            "/exception",
+            {"type": "nested_list_on_serializer"},
+            content_type="application/json",
+        )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert response.data == {
-            "type": "validation_error",
-            "code": "required",
-            "detail": "This field is required.",
-            "attr": "name",
-        }
+        assert response.data == _RES_REQUIRED_NAME
 
+    @pytest.mark.parametrize(
+        "error_type", ["api_error", "assertion_error", "arithmetic_error", "key_error"]
+    )
     def test_unhandled_server_error(
-        self,
-        test_client,
-        res_server_error,
-        settings,
-        monkeypatch,
+        self, django_client, res_server_error, error_type
     ) -> None:
         """
         Tests generic unhandled Python exceptions. Note we assert that a generic
         error message is returned in these cases to avoid leaking sensitive information.
         """
-
-        # API error
-        response = test_client.post("/exception", {"type": "api_error"})
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        assert response.data == res_server_error
-
-        # Assertion error
-        response = test_client.post("/exception", {"type": "assertion_error"})
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        assert response.data == res_server_error
-
-        # Arithmetic error
-        response = test_client.post("/exception", {"type": "arithmetic_error"})
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        assert response.data == res_server_error
-
-        # Key error
-        response = test_client.post("/exception", {"type": "key_error"})
+        response = django_client.post(
+            "/exception", {"type": error_type}, content_type="application/json"
+        )
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert response.data == res_server_error
 
+    def test_unhandled_server_error_with_enabled_in_debug(
+        self, django_client, res_server_error, settings, monkeypatch
+    ) -> None:
         # Exception (even on debug but with ENABLE_IN_DEBUG)
         settings.DEBUG = True
         monkeypatch.setattr(api_settings, "ENABLE_IN_DEBUG", True)
-        response = test_client.post("/exception")
+        response = django_client.post("/exception")
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert response.data == res_server_error
 
+    @pytest.mark.django_db
     def test_rollback_transactions_normally(
-        self, test_client, res_server_error
+        self, django_client, res_server_error
     ) -> None:
         count = Hedgehog.objects.count()
 
-        response = test_client.post("/exception", {"type": "atomic_transaction"})
+        response = django_client.post(
+            "/exception",
+            {"type": "atomic_transaction"},
+            content_type="application/json",
+        )
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert response.data == res_server_error
 
         assert Hedgehog.objects.count() == count + 1  # only one object is committed
 
     def test_custom_exception_reporting_is_called(
-        self, monkeypatch, test_client, res_server_error
+        self, monkeypatch, django_client, res_server_error
     ) -> None:
 
         mock = Mock(return_value=None)  # No event ID is returned
         monkeypatch.setattr(api_settings, "EXCEPTION_REPORTING", mock)
 
-        response = test_client.post("/exception", {"type": "assertion_error"})
+        response = django_client.post(
+            "/exception", {"type": "assertion_error"}, content_type="application/json"
+        )
 
         # Assert that the reporting function was called correctly
         mock.assert_called_once()
@@ -163,13 +185,15 @@ class TestAPI:
         assert response.data == res_server_error
 
     def test_custom_exception_reporting_includes_event_id(
-        self, monkeypatch, test_client, res_server_error
+        self, monkeypatch, django_client, res_server_error
     ) -> None:
 
         mock = Mock(return_value="abc-123")  # Event ID `abc-123` is returned
         monkeypatch.setattr(api_settings, "EXCEPTION_REPORTING", mock)
 
-        response = test_client.post("/exception", {"type": "assertion_error"})
+        response = django_client.post(
+            "/exception", {"type": "assertion_error"}, content_type="application/json"
+        )
 
         # Assert that the reporting function was called correctly
         mock.assert_called_once()
@@ -182,15 +206,21 @@ class TestAPI:
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert response.data == {**res_server_error, "error_event_id": "abc-123"}
 
-    def test_yield_non_drf_exceptions_to_django_in_debug(self, test_client, settings):
+    def test_yield_non_drf_exceptions_to_django_in_debug(self, django_client, settings):
         settings.DEBUG = True
 
         # Key Error
         with pytest.raises(KeyError) as e:
-            test_client.post("/exception", {"type": "key_error"})
+            django_client.post(
+                "/exception", {"type": "key_error"}, content_type="application/json"
+            )
         assert e.typename == "KeyError"
 
         # Assertion Error
         with pytest.raises(AssertionError) as e:
-            test_client.post("/exception", {"type": "assertion_error"})
+            django_client.post(
+                "/exception",
+                {"type": "assertion_error"},
+                content_type="application/json",
+            )
         assert e.typename == "AssertionError"
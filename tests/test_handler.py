@@ -1,103 +1,282 @@
-from unittest.mock import patch
+from types import MappingProxyType
+from typing import Optional
+from unittest.mock import Mock
 
+import pytest
 from django.core.exceptions import PermissionDenied
+from django.core.signals import got_request_exception
 from django.db.models import ProtectedError
 from django.http import Http404
+from django.test import override_settings
 from rest_framework import exceptions, status
 from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.response import Response
 
 from exceptions_hog.handler import exception_handler
 from exceptions_hog.settings import api_settings
 
-# DRF exceptions
+# Older versions in the CI test matrix don't have headers on Response
+_HAS_HEADERS = hasattr(Response(), "headers")
 
+# Validation errors for a complex nested serializer (not mutated by `ValidationError`)
+_COMPLEX_NESTED_ERRORS = {
+    "parent": {
+        "l1_attr": {
+            "l2_attr": {
+                "l3_attr": ErrorDetail(string="Focus on this error.", code="focus"),
+            },
+            "l2_attr_2": {
+                "l3_attr_2": [
+                    ErrorDetail(
+                        string="This field is also invalid.", code="invalid_too"
+                    )
+                ]
+            },
+        },
+        "l1_attr_2": [
+            ErrorDetail(string="This field is also invalid.", code="invalid_too")
+        ],
+    }
+}
 
-def test_not_acceptable_exception() -> None:
-    response = exception_handler(exceptions.NotAcceptable())
-    assert response is not None
-    assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
-    assert response.data == {
+# Expected responses
+_RES_NOT_ACCEPTABLE = MappingProxyType(
+    {
         "type": "invalid_request",
         "code": "not_acceptable",
         "detail": "Could not satisfy the request Accept header.",
         "attr": None,
     }
-
-
-def test_unsupported_media_type_exception() -> None:
-    response = exception_handler(exceptions.UnsupportedMediaType("application/xml"))
-    assert response is not None
-    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
-    assert response.data == {
+)
+_RES_UNSUPPORTED_MEDIA_TYPE = MappingProxyType(
+    {
         "type": "invalid_request",
         "code": "unsupported_media_type",
         "detail": 'Unsupported media type "application/xml" in request.',
         "attr": None,
     }
-
-
-def test_throttled_exception() -> None:
-    response = exception_handler(exceptions.Throttled(62))
-    assert response is not None
-    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-    assert response.data == {
+)
+_RES_THROTTLED_62 = MappingProxyType(
+    {
         "type": "throttled_error",
         "code": "throttled",
         "detail": "Request was throttled. Expected available in 62 seconds.",
         "attr": None,
     }
+)
+_RES_EXTRA_SERVER_ERROR = MappingProxyType(
+    {
+        "type": "server_error",
+        "code": "error",
+        "detail": "A server error occurred.",
+        "attr": None,
+        "extra": {"id": "123"},
+    }
+)
+_RES_MULTIPLE = MappingProxyType(
+    {
+        "type": "multiple",
+        "code": "multiple",
+        "detail": "Multiple exceptions ocurred. Please check list for details.",
+        "attr": None,
+        "list": [
+            {
+                "type": "validation_error",
+                "code": "required",
+                "detail": "This field is required.",
+                "attr": "email",
+            },
+            {
+                "type": "validation_error",
+                "code": "unsafe_password",
+                "detail": "This password is unsafe.",
+                "attr": "password",
+            },
+        ],
+    }
+)
+_RES_MULTIPLE_EXTRA = MappingProxyType({**_RES_MULTIPLE, "extra": {"id": "123"}})
+_RES_COMPLEX_NESTED = MappingProxyType(
+    {
+        "type": "validation_error",
+        "code": "focus",
+        "detail": "Focus on this error.",
+        "attr": "parent__l1_attr__l2_attr__l3_attr",
+    }
+)
+_RES_MULTIPLE_COMPLEX_NESTED = MappingProxyType(
+    {
+        "type": "multiple",
+        "code": "multiple",
+        "detail": "Multiple exceptions ocurred. Please check list for details.",
+        "attr": None,
+        "list": [
+            {
+                "type": "validation_error",
+                "code": "focus",
+                "detail": "Focus on this error.",
+                "attr": "parent__l1_attr__l2_attr__l3_attr",
+            },
+            {
+                "type": "validation_error",
+                "code": "invalid_too",
+                "detail": "This field is also invalid.",
+                "attr": "parent__l1_attr__l2_attr_2__l3_attr_2",
+            },
+            {
+                "type": "validation_error",
+                "code": "invalid_too",
+                "detail": "This field is also invalid.",
+                "attr": "parent__l1_attr_2",
+            },
+        ],
+    }
+)
+
+
+class _ExtraException(Exception):
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
+        self.extra = {"id": "123"}
+
+
+class _ExtraValidationError(exceptions.ValidationError):
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
+        self.extra = {"id": "123"}
+
+
+def _handled(exc: BaseException, expected_status: int) -> Response:
+    """
+    Asserts that `exc` is handled with `expected_status` and returns the response.
+    """
+    response = exception_handler(exc)
+    assert response is not None
+    assert response.status_code == expected_status
+    return response
+
+
+def _assert_handled(
+    exc: BaseException,
+    *,
+    status_code: int,
+    type_: str,
+    code: str,
+    detail: str,
+    attr: Optional[str] = None,
+) -> Response:
+    """
+    Asserts that `exc` is handled with a single exception response. Fields are
+    compared one by one so a failure points at the offending field.
+    """
+    response = _handled(exc, status_code)
+    assert response.data.keys() == {"type", "code", "detail", "attr"}
+    assert response.data["type"] == type_
+    assert response.data["code"] == code
+    assert response.data["detail"] == detail
+    assert response.data["attr"] == attr
+    return response
+
+
+# DRF exceptions
+
+
+@pytest.mark.parametrize(
+    "exc,status_code,expected_data",
+    [
+        (
+            exceptions.NotAcceptable(),
+            status.HTTP_406_NOT_ACCEPTABLE,
+            _RES_NOT_ACCEPTABLE,
+        ),
+        (
+            exceptions.UnsupportedMediaType("application/xml"),
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            _RES_UNSUPPORTED_MEDIA_TYPE,
+        ),
+        (
+            exceptions.Throttled(62),
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            _RES_THROTTLED_62,
+        ),
+    ],
+    ids=["not_acceptable", "unsupported_media_type", "throttled"],
+)
+def test_drf_exception(exc, status_code, expected_data) -> None:
+    assert _handled(exc, status_code).data == expected_data
+
+
+def test_drf_exception_subclass() -> None:
+    class TeapotNotFound(exceptions.NotFound):
+        default_detail = "The teapot could not be found."
+
+    _assert_handled(
+        TeapotNotFound(),
+        status_code=status.HTTP_404_NOT_FOUND,
+        type_="invalid_request",
+        code="not_found",
+        detail="The teapot could not be found.",
+    )
+
+
+class _PropertyTypeException(exceptions.APIException):
+    @property
+    def default_type(self) -> str:
+        return "property_error"
+
+
+def test_default_type_is_read_from_the_instance() -> None:
+    server_error = status.HTTP_500_INTERNAL_SERVER_ERROR
+    instance_exc = exceptions.APIException()
+    instance_exc.default_type = "instance_error"  # type: ignore
+    assert _handled(instance_exc, server_error).data["type"] == "instance_error"
+
+    # Not frozen by the per-class cache
+    response = _handled(exceptions.APIException(), server_error)
+    assert response.data["type"] == "server_error"
+    response = _handled(_PropertyTypeException(), server_error)
+    assert response.data["type"] == "property_error"
 
 
 def test_validation_error() -> None:
     # Default code
-    response = exception_handler(
-        exceptions.ValidationError("I did not like your input.")
+    _assert_handled(
+        exceptions.ValidationError("I did not like your input."),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="invalid_input",  # Default code for `validation_error`
+        detail="I did not like your input.",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "invalid_input",  # Default code for `validation_error`
-        "detail": "I did not like your input.",
-        "attr": None,
-    }
 
     # Custom code
-    response = exception_handler(
-        exceptions.ValidationError("I did not like your input.", code="ugly_input")
+    _assert_handled(
+        exceptions.ValidationError("I did not like your input.", code="ugly_input"),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="ugly_input",
+        detail="I did not like your input.",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "ugly_input",  # Default code for `validation_error`
-        "detail": "I did not like your input.",
-        "attr": None,
-    }
 
 
 def test_validation_error_serializer_field() -> None:
-    response = exception_handler(
+    _assert_handled(
         exceptions.ValidationError(
             {
                 "phone_number": [
                     ErrorDetail(string="This field is required.", code="required")
                 ]
             }
-        )
+        ),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="required",
+        detail="This field is required.",
+        attr="phone_number",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "required",
-        "detail": "This field is required.",
-        "attr": "phone_number",
-    }
 
 
 def test_validation_error_with_simple_nested_serializer_field() -> None:
-    response = exception_handler(
+    _assert_handled(
         exceptions.ValidationError(
             {
                 "parent": {
@@ -111,117 +290,41 @@ def test_validation_error_with_simple_nested_serializer_field() -> None:
                     ],
                 }
             }
-        )
+        ),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="required",
+        detail="This field is required.",
+        attr="parent__children_attr",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "required",
-        "detail": "This field is required.",
-        "attr": "parent__children_attr",
-    }
 
 
 def test_extra_attribute() -> None:
-    class ExtraException(Exception):
-        def __init__(self, *args: object) -> None:
-            super().__init__(*args)
-            self.extra = {"id": "123"}  # type: ignore
-
-    response = exception_handler(ExtraException())
-    assert response is not None
-    assert response.data == {
-        "type": "server_error",
-        "code": "error",
-        "detail": "A server error occurred.",
-        "attr": None,
-        "extra": {"id": "123"},
-    }
+    assert (
+        _handled(_ExtraException(), status.HTTP_500_INTERNAL_SERVER_ERROR).data
+        == _RES_EXTRA_SERVER_ERROR
+    )
 
 
-def test_extra_attribute_with_multiple_exceptions(monkeypatch) -> None:
-    monkeypatch.setattr(api_settings, "SUPPORT_MULTIPLE_EXCEPTIONS", True)
+@pytest.fixture(scope="module")
+def complex_nested_validation_error() -> exceptions.ValidationError:
+    # The handler doesn't mutate the exception, so it's shared across test cases
+    return exceptions.ValidationError(_COMPLEX_NESTED_ERRORS)
 
-    class ExtraException(exceptions.ValidationError):
-        def __init__(self, *args: object) -> None:
-            super().__init__(*args)
-            self.extra = {"id": "123"}  # type: ignore
 
-    response = exception_handler(
-        ExtraException(
-            {
-                "email": ErrorDetail(string="This field is required.", code="required"),
-                "password": [
-                    ErrorDetail(
-                        string="This password is unsafe.",
-                        code="unsafe_password",
-                    )
-                ],
-            },
-        )
-    )
-    assert response is not None
-    assert response.data == {
-        "type": "multiple",
-        "code": "multiple",
-        "detail": "Multiple exceptions ocurred. Please check list for details.",
-        "attr": None,
-        "extra": {"id": "123"},
-        "list": [
-            {
-                "type": "validation_error",
-                "code": "required",
-                "detail": "This field is required.",
-                "attr": "email",
-            },
-            {
-                "type": "validation_error",
-                "code": "unsafe_password",
-                "detail": "This password is unsafe.",
-                "attr": "password",
-            },
-        ],
-    }
-
-
-def test_validation_error_with_complex_nested_serializer_field() -> None:
-    response = exception_handler(
-        exceptions.ValidationError(
-            {
-                "parent": {
-                    "l1_attr": {
-                        "l2_attr": {
-                            "l3_attr": ErrorDetail(
-                                string="Focus on this error.", code="focus"
-                            ),
-                        },
-                        "l2_attr_2": {
-                            "l3_attr_2": [
-                                ErrorDetail(
-                                    string="This field is also invalid.",
-                                    code="invalid_too",
-                                )
-                            ]
-                        },
-                    },
-                    "l1_attr_2": [
-                        ErrorDetail(
-                            string="This field is also invalid.", code="invalid_too"
-                        )
-                    ],
-                }
-            }
-        )
+@pytest.mark.parametrize(
+    "multiple,expected_data",
+    [(False, _RES_COMPLEX_NESTED), (True, _RES_MULTIPLE_COMPLEX_NESTED)],
+    ids=["single", "multiple"],
+)
+def test_validation_error_with_complex_nested_serializer_field(
+    complex_nested_validation_error, monkeypatch, multiple, expected_data
+) -> None:
+    monkeypatch.setattr(api_settings, "SUPPORT_MULTIPLE_EXCEPTIONS", multiple)
+    assert (
+        _handled(complex_nested_validation_error, status.HTTP_400_BAD_REQUEST).data
+        == expected_data
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "focus",
-        "detail": "Focus on this error.",
-        "attr": "parent__l1_attr__l2_attr__l3_attr",
-    }
 
 
 def test_nested_serializer_field_with_special_characters() -> None:
@@ -229,7 +332,7 @@ def test_nested_serializer_field_with_special_characters() -> None:
     Tests proper handling of the edge case of an attribute name using the same characters
     as the `NESTED_KEY_SEPARATOR`.
     """
-    response = exception_handler(
+    _assert_handled(
         exceptions.ValidationError(
             {
                 "my__special___attribute": {
@@ -238,112 +341,89 @@ def test_nested_serializer_field_with_special_characters() -> None:
                     ],
                 }
             }
-        )
+        ),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="required",
+        detail="This field is required.",
+        attr="my__special___attribute__children_attr",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "required",
-        "detail": "This field is required.",
-        "attr": "my__special___attribute__children_attr",
-    }
 
 
 # Django & DRF exceptions
 
 
-def test_throttled_exception_with_no_wait() -> None:
-    throttled = exceptions.Throttled(wait=None)
-    response = exception_handler(throttled)
-    assert response is not None
-    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-    assert response.data == {
-        "attr": None,
-        "code": "throttled",
-        "detail": "Request was throttled.",
-        "type": "throttled_error",
-    }
-    # older versions in the CI test matrix don't have headers on Response
-    if getattr(response, "headers", None):
+@pytest.mark.parametrize(
+    "wait,detail,retry_after",
+    [
+        (None, "Request was throttled.", None),
+        (100, "Request was throttled. Expected available in 100 seconds.", "100"),
+    ],
+    ids=["no_wait", "wait"],
+)
+def test_throttled_exception_retry_after(wait, detail, retry_after) -> None:
+    response = _assert_handled(
+        exceptions.Throttled(wait=wait),
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        type_="throttled_error",
+        code="throttled",
+        detail=detail,
+    )
+    if not _HAS_HEADERS:
+        return  # Only the body can be checked without `Response.headers`
+    if retry_after:
+        assert response.headers["Retry-After"] == retry_after
+    else:
         assert "Retry-After" not in response.headers
 
 
-def test_throttled_exception_with_wait() -> None:
-    throttled = exceptions.Throttled(wait=100)
-    response = exception_handler(throttled)
-    assert response is not None
-    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-    assert response.data == {
-        "attr": None,
-        "code": "throttled",
-        "detail": "Request was throttled. Expected available in 100 seconds.",
-        "type": "throttled_error",
-    }
-    # older versions in the CI test matrix don't have headers on Response
-    if getattr(response, "headers", None):
-        assert response.headers["Retry-After"] == "100"
-
+# Django base exceptions are handled the same as their DRF counterparts
+@pytest.mark.parametrize(
+    "exc", [exceptions.NotFound(), Http404()], ids=["drf", "django"]
+)
+def test_not_found_exception(exc, res_not_found) -> None:
+    assert _handled(exc, status.HTTP_404_NOT_FOUND).data == res_not_found
 
-def test_not_found_exception(res_not_found) -> None:
-    response = exception_handler(exceptions.NotFound())
-    assert response is not None
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.data == res_not_found
-
-    # Test Django base exception too
-    response = exception_handler(Http404())
-    assert response is not None
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.data == res_not_found
 
+@pytest.mark.parametrize(
+    "exc", [exceptions.PermissionDenied(), PermissionDenied()], ids=["drf", "django"]
+)
+def test_permission_denied_exception(exc, res_permission_denied) -> None:
+    assert _handled(exc, status.HTTP_403_FORBIDDEN).data == res_permission_denied
 
-def test_permission_denied_exception(res_permission_denied) -> None:
-    response = exception_handler(exceptions.PermissionDenied())
-    assert response is not None
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-    assert response.data == res_permission_denied
 
-    # Test Django base exception too
-    response = exception_handler(PermissionDenied())
-    assert response is not None
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-    assert response.data == res_permission_denied
+@pytest.fixture(scope="module")
+def protected_error() -> ProtectedError:
+    return ProtectedError(
+        "Resource 'Hedgehog' has dependencies.", protected_objects=[1]
+    )
 
 
-def test_protected_error() -> None:
-    response = exception_handler(
-        ProtectedError("Resource 'Hedgehog' has dependencies.", protected_objects=[1])
-    )
-    assert response is not None
-    assert response.status_code == status.HTTP_409_CONFLICT
-    assert response.data == {
-        "type": "invalid_request",
-        "code": "protected_error",
-        "detail": "Requested operation cannot be completed because"
+def test_protected_error(protected_error) -> None:
+    _assert_handled(
+        protected_error,
+        status_code=status.HTTP_409_CONFLICT,
+        type_="invalid_request",
+        code="protected_error",
+        detail="Requested operation cannot be completed because"
         " a related object is protected.",
-        "attr": None,
-    }
+    )
 
 
 def test_unique_together_exception() -> None:
     """
     Asserts special handling of __all__ exceptions.
     """
-    response = exception_handler(
+    _assert_handled(
         ValidationError(
             {"__all__": ["User with this name and email already exists."]},
             code="unique_together",
-        )
+        ),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="unique_together",
+        detail="User with this name and email already exists.",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "unique_together",
-        "detail": "User with this name and email already exists.",
-        "attr": None,
-    }
 
 
 def test_non_field_errors_exception() -> None:
@@ -351,19 +431,15 @@ def test_non_field_errors_exception() -> None:
     Asserts special handling of non_field_errors exceptions.
     https://www.django-rest-framework.org/api-guide/settings/#non_field_errors_key
     """
-    response = exception_handler(
+    _assert_handled(
         ValidationError(
             {"non_field_errors": ["This form is invalid."]},
-        )
+        ),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="invalid_input",
+        detail="This form is invalid.",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "invalid_input",
-        "detail": "This form is invalid.",
-        "attr": None,
-    }
 
 
 def test_non_field_errors_exception_with_custom_key(settings) -> None:
@@ -377,207 +453,166 @@ def test_non_field_errors_exception_with_custom_key(settings) -> None:
         "NON_FIELD_ERRORS_KEY": "my_custom_error_key",
     }
 
-    response = exception_handler(
+    _assert_handled(
         ValidationError(
             {"my_custom_error_key": ["This form is invalid."]},
-        )
+        ),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        type_="validation_error",
+        code="invalid_input",
+        detail="This form is invalid.",
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "validation_error",
-        "code": "invalid_input",
-        "detail": "This form is invalid.",
-        "attr": None,
-    }
 
 
 # Python exceptions
 
 
-def test_not_implemented_error(res_server_error) -> None:
-    response = exception_handler(
-        NotImplementedError("This function is not implemented")
+@pytest.mark.parametrize(
+    "exc_cls", [NotImplementedError, AttributeError, ImportError, TypeError]
+)
+def test_python_exception(exc_cls, res_server_error) -> None:
+    assert (
+        _handled(
+            exc_cls("Make sure this isn't leaked in the response."),
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        ).data
+        == res_server_error
     )
-    assert response is not None
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert response.data == res_server_error
 
 
-def test_attribute_error(res_server_error) -> None:
-    response = exception_handler(AttributeError())
-    assert response is not None
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert response.data == res_server_error
+# Exception handling in DEBUG mode
 
 
-def test_import_error(res_server_error) -> None:
-    response = exception_handler(ImportError())
-    assert response is not None
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert response.data == res_server_error
+@pytest.fixture(scope="class")
+def debug_mode():
+    with override_settings(DEBUG=True):
+        yield
 
 
-def test_type_error(res_server_error) -> None:
-    response = exception_handler(TypeError())
-    assert response is not None
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert response.data == res_server_error
+@pytest.mark.usefixtures("debug_mode")
+class TestDebugMode:
+    def test_drf_exception_in_debug(self) -> None:
+        # Exception is handled as usual with the exceptions_hog handler
+        _assert_handled(
+            exceptions.Throttled(28),
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            type_="throttled_error",
+            code="throttled",
+            detail="Request was throttled. Expected available in 28 seconds.",
+        )
 
+    def test_not_found_exception_in_debug(self, res_not_found) -> None:
+        # Same as normal, since exception is an APIException instance
+        assert (
+            _handled(exceptions.NotFound(), status.HTTP_404_NOT_FOUND).data
+            == res_not_found
+        )
 
-# Exception handling in DEBUG mode
+        # Test Django base 404 exception too
+        assert _handled(Http404(), status.HTTP_404_NOT_FOUND).data == res_not_found
 
+    def test_python_exception_in_debug(self, monkeypatch) -> None:
+        mock_django_exception = Mock()
+        monkeypatch.setattr(got_request_exception, "send", mock_django_exception)
 
-def test_drf_exception_in_debug(settings) -> None:
-    settings.DEBUG = True
+        # Not handled, since not APIException instance
+        response = exception_handler(TypeError())
+        assert response is None
+        mock_django_exception.assert_called_once_with(sender=None, request=None)
 
-    # Exception is handled as usual with the exceptions_hog handler
-    response = exception_handler(exceptions.Throttled(28))
-    assert response is not None
-    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-    assert response.data == {
-        "type": "throttled_error",
-        "code": "throttled",
-        "detail": "Request was throttled. Expected available in 28 seconds.",
-        "attr": None,
-    }
+    def test_python_exception_with_enabled_in_debug(
+        self, res_server_error, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(api_settings, "ENABLE_IN_DEBUG", True)
+
+        # Handled by exceptions_hog since `ENABLE_IN_DEBUG` is `True`
+        assert (
+            _handled(TypeError(), status.HTTP_500_INTERNAL_SERVER_ERROR).data
+            == res_server_error
+        )
 
 
-def test_not_found_exception_in_debug(settings, res_not_found) -> None:
-    settings.DEBUG = True
+# Multiple exceptions
 
-    # Same as normal, since exception is an APIException instance
-    response = exception_handler(exceptions.NotFound())
-    assert response is not None
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.data == res_not_found
 
-    # Test Django base 404 exception too
-    response = exception_handler(Http404())
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.data == res_not_found
+@pytest.fixture(scope="class")
+def support_multiple_exceptions():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(api_settings, "SUPPORT_MULTIPLE_EXCEPTIONS", True)
+        yield
 
 
-@patch("django.core.signals.got_request_exception.send")
-def test_python_exception_in_debug(mock_django_exception, settings) -> None:
-    settings.DEBUG = True
-    # Not handled, since not APIException instance
-    response = exception_handler(TypeError())
-    assert response is None
-    mock_django_exception.assert_called_once_with(sender=None, request=None)
+@pytest.mark.usefixtures("support_multiple_exceptions")
+class TestMultipleExceptions:
+    def test_extra_attribute_with_multiple_exceptions(self) -> None:
+        data = _handled(
+            _ExtraValidationError(
+                {
+                    "email": ErrorDetail(
+                        string="This field is required.", code="required"
+                    ),
+                    "password": [
+                        ErrorDetail(
+                            string="This password is unsafe.",
+                            code="unsafe_password",
+                        )
+                    ],
+                },
+            ),
+            status.HTTP_400_BAD_REQUEST,
+        ).data
+        assert data == _RES_MULTIPLE_EXTRA
+
+    def test_list_response_validation_error_with_multiple_exceptions(self) -> None:
+        assert (
+            _handled(
+                exceptions.ValidationError(
+                    {
+                        "email": ErrorDetail(
+                            string="This field is required.", code="required"
+                        ),
+                        "password": [
+                            ErrorDetail(
+                                string="This password is unsafe.",
+                                code="unsafe_password",
+                            )
+                        ],
+                    },
+                ),
+                status.HTTP_400_BAD_REQUEST,
+            ).data
+            == _RES_MULTIPLE
+        )
 
 
-def test_python_exception_with_enabled_in_debug(
-    res_server_error, settings, monkeypatch
-) -> None:
-    settings.DEBUG = True
-    monkeypatch.setattr(api_settings, "ENABLE_IN_DEBUG", True)
+# Settings
 
-    # Handled by exceptions_hog since `ENABLE_IN_DEBUG` is `True`
-    response = exception_handler(TypeError())
-    assert response is not None
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert response.data == res_server_error
 
+def test_settings_are_reloaded_when_changed(settings) -> None:
+    settings.EXCEPTIONS_HOG = {"SUPPORT_MULTIPLE_EXCEPTIONS": True}
+    assert api_settings.SUPPORT_MULTIPLE_EXCEPTIONS is True
 
-def test_list_response_validation_error_with_multiple_exceptions(
-    monkeypatch,
-) -> None:
-    monkeypatch.setattr(api_settings, "SUPPORT_MULTIPLE_EXCEPTIONS", True)
-    response = exception_handler(
+    data = _handled(
         exceptions.ValidationError(
             {
                 "email": ErrorDetail(string="This field is required.", code="required"),
-                "password": [
-                    ErrorDetail(
-                        string="This password is unsafe.",
-                        code="unsafe_password",
-                    )
-                ],
+                "password": ErrorDetail(
+                    string="This field is required.", code="required"
+                ),
             },
-        )
-    )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "multiple",
-        "code": "multiple",
-        "detail": "Multiple exceptions ocurred. Please check list for details.",
-        "attr": None,
-        "list": [
-            {
-                "type": "validation_error",
-                "code": "required",
-                "detail": "This field is required.",
-                "attr": "email",
-            },
-            {
-                "type": "validation_error",
-                "code": "unsafe_password",
-                "detail": "This password is unsafe.",
-                "attr": "password",
-            },
-        ],
-    }
+        ),
+        status.HTTP_400_BAD_REQUEST,
+    ).data
+    assert data["type"] == "multiple"
+    assert len(data["list"]) == 2
 
 
-def test_list_response_validation_error_with_complex_nested_serializer_field(
-    monkeypatch,
-) -> None:
-    monkeypatch.setattr(api_settings, "SUPPORT_MULTIPLE_EXCEPTIONS", True)
-    response = exception_handler(
-        exceptions.ValidationError(
-            {
-                "parent": {
-                    "l1_attr": {
-                        "l2_attr": {
-                            "l3_attr": ErrorDetail(
-                                string="Focus on this error.", code="focus"
-                            ),
-                        },
-                        "l2_attr_2": {
-                            "l3_attr_2": [
-                                ErrorDetail(
-                                    string="This field is also invalid.",
-                                    code="invalid_too",
-                                )
-                            ]
-                        },
-                    },
-                    "l1_attr_2": [
-                        ErrorDetail(
-                            string="This field is also invalid.", code="invalid_too"
-                        )
-                    ],
-                }
-            }
-        )
-    )
-    assert response is not None
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data == {
-        "type": "multiple",
-        "code": "multiple",
-        "detail": "Multiple exceptions ocurred. Please check list for details.",
-        "attr": None,
-        "list": [
-            {
-                "type": "validation_error",
-                "code": "focus",
-                "detail": "Focus on this error.",
-                "attr": "parent__l1_attr__l2_attr__l3_attr",
-            },
-            {
-                "type": "validation_error",
-                "code": "invalid_too",
-                "detail": "This field is also invalid.",
-                "attr": "parent__l1_attr__l2_attr_2__l3_attr_2",
-            },
-            {
-                "type": "validation_error",
-                "code": "invalid_too",
-                "detail": "This field is also invalid.",
-                "attr": "parent__l1_attr_2",
-            },
-        ],
+def test_settings_are_not_read_from_rest_framework(settings) -> None:
+    # Without `EXCEPTIONS_HOG`, settings under `REST_FRAMEWORK` are not a fallback
+    assert not hasattr(settings, "EXCEPTIONS_HOG")
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "SUPPORT_MULTIPLE_EXCEPTIONS": True,
     }
+    api_settings.reload()
+    assert api_settings.SUPPORT_MULTIPLE_EXCEPTIONS is False